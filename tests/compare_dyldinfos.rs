@@ -1,21 +1,28 @@
-use std::process;
+use std::process::{self, Stdio};
 
 fn get_realpath(cmd: &str) -> String {
     let output = process::Command::new("/usr/bin/xcrun")
         .arg("-f")
         .arg(cmd)
+        .stderr(Stdio::null())
         .output()
         .expect("can get realpath");
-    String::from_utf8(output.stdout).expect("output is valid utf8")
+    // xcrun terminates the path with a newline; only the path itself is kept
+    let path = output.stdout.split(|&b| b == b'\n').next().unwrap_or(&[]);
+    String::from_utf8(path.to_vec()).expect("output is valid utf8")
 }
 
 pub fn compare(args: Vec<&str>) {
+    // spawn both tools up front so they run concurrently; we only block once
+    // we need their output
     let apple = process::Command::new("/usr/bin/xcrun")
         .arg("dyldinfo")
         .arg("-arch")
         .arg("x86_64")
         .args(&args)
-        .output()
+        .stdout(Stdio::piped())
+        .stderr(Stdio::null())
+        .spawn()
         .expect("run Apple dyldinfo");
 
     let goblin = process::Command::new("cargo")
@@ -27,9 +34,14 @@ pub fn compare(args: Vec<&str>) {
         .arg("-arch")
         .arg("x86_64")
         .args(&args)
-        .output()
+        .stdout(Stdio::piped())
+        .stderr(Stdio::inherit())
+        .spawn()
         .expect("run cargo dyldinfo");
 
+    let apple = apple.wait_with_output().expect("wait for Apple dyldinfo");
+    let goblin = goblin.wait_with_output().expect("wait for cargo dyldinfo");
+
     if apple.stdout.as_slice() != goblin.stdout.as_slice() {
         println!("dyldinfo calls disagree!");
         println!(